@@ -22,10 +22,17 @@ public class TCPClient : MonoBehaviour
     public bool isGestureTransitioning = false;
     public float handX = 0.0f;
     public float handY = 0.0f;
+    public string trackingMode = "active";
+    public Vector2 handVelocity = Vector2.zero;
+    public Vector2 handAcceleration = Vector2.zero;
+    public double captureTimestamp = 0.0;
 
     [Header("//Debug")]
     public bool enableDebugLogging = false;
 
+    // Same extrapolation cap as the server's MAX_PREDICTION_TIME
+    private const float MaxPredictionTime = 0.2f;
+
     private TcpClient client;
     private NetworkStream stream;
     private Thread clientThread;
@@ -110,6 +117,9 @@ public class TCPClient : MonoBehaviour
             bool newTransitioning = currentGestureState.is_transitioning;
             float newHandX = currentGestureState.hand_x;
             float newHandY = currentGestureState.hand_y;
+            string newTrackingMode = currentGestureState.tracking_mode ?? "active";
+            Vector2 newHandVelocity = new Vector2(currentGestureState.velocity_x, currentGestureState.velocity_y);
+            Vector2 newHandAcceleration = new Vector2(currentGestureState.acceleration_x, currentGestureState.acceleration_y);
 
             // Check for gesture changes
             if (newGesture != lastGesture)
@@ -135,6 +145,10 @@ public class TCPClient : MonoBehaviour
             isGestureTransitioning = newTransitioning;
             handX = newHandX;
             handY = newHandY;
+            trackingMode = newTrackingMode;
+            handVelocity = newHandVelocity;
+            handAcceleration = newHandAcceleration;
+            captureTimestamp = currentGestureState.capture_timestamp;
 
             // Log gesture data for debugging
             if (enableDebugLogging && Time.frameCount % 30 == 0) // Log every 30 frames
@@ -189,6 +203,11 @@ public class TCPClient : MonoBehaviour
         return isGestureTransitioning;
     }
 
+    public bool IsTrackingIdle()
+    {
+        return trackingMode == "idle";
+    }
+
     public float GetHandX()
     {
         return handX;
@@ -215,6 +234,31 @@ public class TCPClient : MonoBehaviour
         return camera.ScreenToWorldPoint(screenPos);
     }
 
+    public Vector2 GetHandVelocity()
+    {
+        return handVelocity;
+    }
+
+    public Vector2 GetHandAcceleration()
+    {
+        return handAcceleration;
+    }
+
+    // Extrapolate the hand position the given number of seconds past the capture time,
+    // capped at MaxPredictionTime like the server-side predictor.
+    // Returns the (-1, -1) no-hand sentinel unchanged when no hand is tracked.
+    public Vector2 GetPredictedHandPosition(float secondsAhead)
+    {
+        if (!HasValidHandPosition())
+        {
+            return GetHandPosition();
+        }
+
+        secondsAhead = Mathf.Clamp(secondsAhead, 0f, MaxPredictionTime);
+        Vector2 predicted = GetHandPosition() + handVelocity * secondsAhead + 0.5f * handAcceleration * secondsAhead * secondsAhead;
+        return new Vector2(Mathf.Clamp01(predicted.x), Mathf.Clamp01(predicted.y));
+    }
+
     public bool HasValidHandPosition()
     {
         return handX >= 0f && handX <= 1f && handY >= 0f && handY <= 1f;
@@ -365,6 +409,12 @@ public class GestureState
     public bool is_transitioning;
     public float hand_x;
     public float hand_y;
+    public float velocity_x;
+    public float velocity_y;
+    public float acceleration_x;
+    public float acceleration_y;
+    public double capture_timestamp;
+    public string tracking_mode;
     public float timestamp;
 
     public override string ToString()
@@ -2,12 +2,15 @@ import time
 import cv2
 import mediapipe as mp
 import numpy as np
-from collections import deque
 from dataclasses import dataclass
 from typing import List, Tuple
 import math
 from enum import Enum
 
+# Idle governor defaults, shared with GestureServer
+DEFAULT_IDLE_TIMEOUT = 5.0
+DEFAULT_IDLE_PROBE_INTERVAL = 0.1
+
 class GestureMode(Enum):
     FIST_CURL = "fist_curl"
     WRIST_ROTATION = "wrist_rotation"
@@ -17,9 +20,22 @@ class GestureState:
     current_gesture: str = "neutral"
     gesture_start_time: float = 0
     is_transitioning: bool = False
+    candidate_state: str = "neutral"  # hold path candidate (unfiltered signal)
+    fast_candidate: str = "neutral"   # fast path candidate (filtered signal)
+    candidate_evidence: float = 0.0   # fast path evidence 0-1, confirms at 1
+    last_update_time: float = 0.0
     confidence: float = 0.0
     hand_x: float = 0.0
     hand_y: float = 0.0
+    # Hand motion in normalized units per second (per second^2 for acceleration)
+    velocity_x: float = 0.0
+    velocity_y: float = 0.0
+    acceleration_x: float = 0.0
+    acceleration_y: float = 0.0
+    # Wall-clock time the frame behind hand_x/hand_y was captured, taken from the
+    # camera backend timestamp when available, otherwise the time it was read
+    capture_timestamp: float = 0.0
+    tracking_mode: str = "active"  # "active" = full rate, "idle" = low-rate probe
 
 @dataclass
 class CalibrationData:
@@ -36,8 +52,89 @@ class CalibrationData:
     fist_initialized: bool = False
     rotation_initialized: bool = False
 
+class RingBuffer:
+    """Fixed-capacity circular buffer backed by a preallocated numpy array"""
+    def __init__(self, capacity: int, shape: Tuple[int, ...] = (), dtype=np.float64):
+        self.capacity = capacity
+        self.data = np.zeros((capacity,) + shape, dtype=dtype)
+        self.index = 0
+        self.count = 0
+
+    def append(self, value):
+        self.data[self.index] = value
+        self.index = (self.index + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+
+    def clear(self):
+        self.index = 0
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, i: int):
+        """Index oldest-first, negative indices count back from the newest entry"""
+        if i < 0:
+            i += self.count
+        if not 0 <= i < self.count:
+            raise IndexError("RingBuffer index out of range")
+        return self.data[(self.index - self.count + i) % self.capacity]
+
+    def values(self) -> np.ndarray:
+        """Return the buffered entries oldest-first"""
+        order = (np.arange(self.count) + self.index - self.count) % self.capacity
+        return self.data[order]
+
+class OneEuroFilter:
+    """
+    One Euro filter (Casiez et al., 2012): a low-pass filter whose cutoff rises
+    with the signal's speed, so jitter is removed at rest without adding lag
+    to fast movements.
+    """
+    def __init__(self, min_cutoff: float = 1.0, beta: float = 0.0, d_cutoff: float = 1.0):
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self.reset()
+
+    def reset(self):
+        self.prev_value = 0.0
+        self.prev_derivative = 0.0
+        self.prev_time = None
+
+    @staticmethod
+    def smoothing_factor(dt: float, cutoff: float) -> float:
+        r = 2 * math.pi * cutoff * dt
+        return r / (r + 1)
+
+    def filter(self, value: float, timestamp: float) -> float:
+        if self.prev_time is None:
+            self.prev_value = value
+            self.prev_time = timestamp
+            return value
+
+        dt = timestamp - self.prev_time
+        if dt <= 0:
+            return self.prev_value
+
+        # Smoothed derivative drives the adaptive cutoff
+        a_d = self.smoothing_factor(dt, self.d_cutoff)
+        derivative = (value - self.prev_value) / dt
+        derivative = a_d * derivative + (1 - a_d) * self.prev_derivative
+
+        cutoff = self.min_cutoff + self.beta * abs(derivative)
+        a = self.smoothing_factor(dt, cutoff)
+        filtered = a * value + (1 - a) * self.prev_value
+
+        self.prev_value = filtered
+        self.prev_derivative = derivative
+        self.prev_time = timestamp
+        return filtered
+
 class GestureRecognizer:
-    def __init__(self, mode: GestureMode = GestureMode.FIST_CURL):
+    def __init__(self, mode: GestureMode = GestureMode.FIST_CURL,
+                 idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+                 idle_probe_interval: float = DEFAULT_IDLE_PROBE_INTERVAL):
         self.mp_hands = mp.solutions.hands
         self.mp_drawing = mp.solutions.drawing_utils
         self.hands = self.mp_hands.Hands(
@@ -51,13 +148,73 @@ class GestureRecognizer:
         self.state = GestureState()
         self.calibration = CalibrationData()
 
-        self.position_history = deque(maxlen=10)
-        self.velocity_history = deque(maxlen=8)
-        self.gesture_history = deque(maxlen=8)
-        self.curl_history = deque(maxlen=10)
-        self.angle_history = deque(maxlen=10)  # New for rotation
-        
+        self.position_history = RingBuffer(10, shape=(2,))
+        self.time_history = RingBuffer(10)
+        self.velocity_history = RingBuffer(8)
+        self.gesture_history = RingBuffer(8, dtype=object)
+        self.curl_history = RingBuffer(10)
+        self.angle_history = RingBuffer(10)  # New for rotation
+        # Unfiltered curl score / palm normal angle over the last second, used
+        # to judge signal noise
+        self.raw_signal_history = RingBuffer(30)
+        # Gesture classified from the unfiltered signal on the latest frame
+        self.unfiltered_gesture = "neutral"
+
+        # Signal filters applied before classification (min_cutoff in Hz,
+        # beta scaled to each signal's units: curl 0-1, angle degrees, position 0-1).
+        # Position uses a high beta so the cursor lags only a few ms while moving.
+        self.curl_filter = OneEuroFilter(min_cutoff=1.0, beta=5.0)
+        self.angle_filter = OneEuroFilter(min_cutoff=1.0, beta=0.05)
+        self.position_filters = (OneEuroFilter(min_cutoff=1.0, beta=50.0),
+                                 OneEuroFilter(min_cutoff=1.0, beta=50.0))
+
+        # Confirmation: as before, a candidate confirms after GESTURE_HOLD_TIME of
+        # agreement of the unfiltered signal. Filtered frames from a quiet, settled
+        # signal close to a calibrated pose also add evidence, shrinking the hold
+        # towards MIN_HOLD_TIME.
         self.GESTURE_HOLD_TIME = 0.3
+        self.MIN_HOLD_TIME = 0.06
+        self.MIN_GESTURE_CONFIDENCE = 0.2
+        # Confidence relative to the margin scored at the calibrated pose,
+        # mapped onto fast-path strength 0-1
+        self.FAST_CONFIDENCE_RANGE = (0.5, 0.8)
+        # Fractions of the smallest calibration spacing: median frame-to-frame
+        # change above NOISE_GATE disables the fast path, and a frame whose
+        # change exceeds SETTLE_THRESHOLD (still moving) adds no fast evidence
+        self.NOISE_GATE = 0.15
+        self.SETTLE_THRESHOLD = 0.1
+        # Running estimate of the camera frame interval; caps how much hold time
+        # a single frame can add after a stall
+        self.frame_interval = 1 / 30
+
+        # Motion estimation: velocity from a linear fit of the last VELOCITY_WINDOW
+        # positions, acceleration from a quadratic fit of the last
+        # ACCELERATION_WINDOW. Estimates within about one deadzone of zero are
+        # shrunk towards it so a resting hand does not make predictions jitter.
+        # Never extrapolate further than MAX_PREDICTION_TIME past the last capture.
+        self.VELOCITY_WINDOW = 6
+        self.ACCELERATION_WINDOW = 10
+        self.VELOCITY_DEADZONE = 0.05  # normalized image units per second
+        self.ACCELERATION_DEADZONE = 1.0  # normalized image units per second squared
+        self.MAX_PREDICTION_TIME = 0.2
+        # (capture_time, position, velocity, acceleration), replaced atomically
+        # so server threads never see a half-updated estimate
+        self.motion_snapshot = None
+
+        # Idle governor: after IDLE_TIMEOUT seconds without a hand, only run a
+        # downscaled detection probe every IDLE_PROBE_INTERVAL seconds. The probe
+        # interval bounds the extra latency before a raised hand is picked up.
+        self.IDLE_TIMEOUT = idle_timeout
+        self.IDLE_PROBE_INTERVAL = idle_probe_interval
+        self.IDLE_PROBE_SCALE = 0.5
+        self.last_hand_time = time.time()
+        self.last_probe_time = 0.0
+
+        # Maps camera backend timestamps (CAP_PROP_POS_MSEC) onto wall-clock time
+        # using the smallest read delay over the last CLOCK_WINDOW frames
+        self.CLOCK_WINDOW = 90
+        self.capture_offsets = RingBuffer(self.CLOCK_WINDOW)
+        self.last_backend_msec = 0.0
         
         self.colors = {
             'neutral': (128, 128, 128),
@@ -74,13 +231,11 @@ class GestureRecognizer:
             'pinky': [17, 18, 19, 20]
         }
 
-    def calculate_palm_orientation_angle(self, landmarks) -> float:
+    def calculate_palm_normal_angle(self, landmarks) -> float:
         """
-        Calculate palm orientation based on the normal vector to the palm plane.
-        Returns angle in degrees where:
-        - 0° = palm facing camera (neutral)
-        - Positive = palm up
-        - Negative = palm down
+        Calculate the unsigned angle in degrees (0-180) between the palm normal
+        and the direction towards the camera. Unlike the signed orientation angle
+        this is continuous, so it is the value that gets filtered.
         """
         # Define three points on the palm to create a plane
         # Using wrist (0), base of middle finger (9), and base of pinky (17)
@@ -114,16 +269,27 @@ class GestureRecognizer:
         
         # Calculate angle in radians, then convert to degrees
         angle_rad = np.arccos(dot_product)
-        angle_deg = np.degrees(angle_rad)
-        
-        # Adjust sign based on hand orientation
-        # If the normal's z-component is positive, palm is facing up
-        if normal_normalized[2] > 0:
-            angle_deg = -angle_deg  # Palm down (negative)
-        else:
-            angle_deg = angle_deg   # Palm up (positive)
-            
-        return angle_deg
+        return float(np.degrees(angle_rad))
+
+    @staticmethod
+    def signed_palm_angle(normal_angle: float) -> float:
+        """
+        Convert the unsigned palm normal angle into the signed orientation angle.
+        Past 90° the normal's z-component is positive, i.e. the palm faces down.
+        """
+        if normal_angle > 90:
+            return -normal_angle  # Palm down (negative)
+        return normal_angle       # Palm up (positive)
+
+    def calculate_palm_orientation_angle(self, landmarks) -> float:
+        """
+        Calculate palm orientation based on the normal vector to the palm plane.
+        Returns angle in degrees where:
+        - 0° = palm facing camera (neutral)
+        - Positive = palm up
+        - Negative = palm down
+        """
+        return self.signed_palm_angle(self.calculate_palm_normal_angle(landmarks))
 
     def calculate_relative_rotation_score(self, current_angle: float) -> dict:
         """Calculate relative scores for rotation gestures based on calibration"""
@@ -146,14 +312,8 @@ class GestureRecognizer:
         
         return scores
 
-    def classify_rotation_gesture(self, landmarks) -> Tuple[str, float, dict]:
-        """Classify gesture based on palm rotation"""
-        angle = self.calculate_palm_orientation_angle(landmarks)
-        self.angle_history.append(angle)
-        
-        # Get relative scores for each gesture
-        scores = self.calculate_relative_rotation_score(angle)
-        
+    def select_gesture(self, scores: dict) -> Tuple[str, float]:
+        """Pick the best-scoring gesture and its margin over the runner-up"""
         # Find the gesture with highest score
         best_gesture = max(scores, key=scores.get)
         best_score = scores[best_gesture]
@@ -166,10 +326,28 @@ class GestureRecognizer:
             confidence = best_score
         
         # Require minimum confidence for non-neutral gestures
-        if best_gesture != 'neutral' and confidence < 0.2:
-            return 'neutral', confidence, scores
+        if best_gesture != 'neutral' and confidence < self.MIN_GESTURE_CONFIDENCE:
+            return 'neutral', confidence
+        
+        return best_gesture, confidence
+
+    def classify_rotation_gesture(self, landmarks, timestamp: float) -> Tuple[str, float, dict]:
+        """Classify gesture based on filtered palm rotation"""
+        # Filter the continuous unsigned angle, then apply the sign: filtering
+        # the signed angle would smear its +90/-90 jump into false neutral frames
+        normal_angle = self.calculate_palm_normal_angle(landmarks)
+        self.raw_signal_history.append(normal_angle)
+        self.unfiltered_gesture, _ = self.select_gesture(
+            self.calculate_relative_rotation_score(self.signed_palm_angle(normal_angle)))
+        normal_angle = self.angle_filter.filter(normal_angle, timestamp)
+        angle = self.signed_palm_angle(normal_angle)
+        self.angle_history.append(angle)
+        
+        # Get relative scores for each gesture
+        scores = self.calculate_relative_rotation_score(angle)
         
-        return best_gesture, confidence, scores
+        gesture, confidence = self.select_gesture(scores)
+        return gesture, confidence, scores
 
     # Keep existing fist curl methods
     def calculate_finger_curl_distance(self, landmarks, finger_name: str) -> float:
@@ -249,75 +427,154 @@ class GestureRecognizer:
         
         return scores
 
-    def classify_curl_gesture(self, landmarks) -> Tuple[str, float, dict]:
-        """Classify gesture using relative scoring for fist curl"""
+    def classify_curl_gesture(self, landmarks, timestamp: float) -> Tuple[str, float, dict]:
+        """Classify gesture using relative scoring for filtered fist curl"""
         curl_score = self.calculate_overall_curl_score(landmarks)
+        self.raw_signal_history.append(curl_score)
+        self.unfiltered_gesture, _ = self.select_gesture(self.calculate_relative_curl_score(curl_score))
+        curl_score = self.curl_filter.filter(curl_score, timestamp)
         self.curl_history.append(curl_score)
         
         # Get relative scores for each gesture
         scores = self.calculate_relative_curl_score(curl_score)
         
-        # Find the gesture with highest score
-        best_gesture = max(scores, key=scores.get)
-        best_score = scores[best_gesture]
-        
-        # Calculate confidence
-        sorted_scores = sorted(scores.values(), reverse=True)
-        if len(sorted_scores) > 1:
-            confidence = sorted_scores[0] - sorted_scores[1]
-        else:
-            confidence = best_score
-        
-        # Require minimum confidence for non-neutral gestures
-        if best_gesture != 'neutral' and confidence < 0.2:
-            return 'neutral', confidence, scores
-        
-        return best_gesture, confidence, scores
+        gesture, confidence = self.select_gesture(scores)
+        return gesture, confidence, scores
 
-    def classify_raw_gesture(self, landmarks) -> Tuple[str, float, dict]:
+    def classify_raw_gesture(self, landmarks, timestamp: float) -> Tuple[str, float, dict]:
         """Classify gesture based on current mode"""
         if self.mode == GestureMode.FIST_CURL:
-            return self.classify_curl_gesture(landmarks)
+            return self.classify_curl_gesture(landmarks, timestamp)
         else:  # WRIST_ROTATION
-            return self.classify_rotation_gesture(landmarks)
+            return self.classify_rotation_gesture(landmarks, timestamp)
+
+    def reset_filters(self):
+        """Drop filter state, e.g. after the hand is lost or the mode changes"""
+        self.curl_filter.reset()
+        self.angle_filter.reset()
+        for position_filter in self.position_filters:
+            position_filter.reset()
+        self.raw_signal_history.clear()
+
+    def reset_state_machine(self):
+        """Abandon any pending transition so evidence cannot carry across a gap"""
+        self.state.is_transitioning = False
+        self.state.candidate_state = self.state.current_gesture
+        self.state.fast_candidate = self.state.current_gesture
+        self.state.candidate_evidence = 0.0
+        self.state.last_update_time = 0.0
 
-    def update_state_machine(self, raw_gesture: str, confidence: float, scores: dict) -> str:
-        """State machine for gesture confirmation"""
-        current_time = time.time()
-        
-        if raw_gesture != self.state.current_gesture:
-            if not self.state.is_transitioning:
-                # Start transition
-                self.state.is_transitioning = True
-                self.state.gesture_start_time = current_time
-                self.state.candidate_state = raw_gesture
-                return self.state.current_gesture
-            else:
-                # Check if we're transitioning to the same candidate
-                if raw_gesture == getattr(self.state, 'candidate_state', None):
-                    # Check if hold time is met
-                    if current_time - self.state.gesture_start_time >= self.GESTURE_HOLD_TIME:
-                        # Confirm gesture change
-                        self.state.current_gesture = raw_gesture
-                        self.state.is_transitioning = False
-
-                        print(f"Gesture: {raw_gesture.upper()}")
-                        print(f"  Confidence: {confidence:.3f}")
-                        if self.mode == GestureMode.FIST_CURL:
-                            print(f"  Scores - Open: {scores['open']:.3f}, Neutral: {scores['neutral']:.3f}, Closed: {scores['closed']:.3f}")
-                        else:
-                            print(f"  Scores - Open: {scores['open']:.3f}, Neutral: {scores['neutral']:.3f}, Closed: {scores['closed']:.3f}")
-                        
-                        return raw_gesture
-                else:
-                    # Different candidate, restart transition
-                    self.state.candidate_state = raw_gesture
-                    self.state.gesture_start_time = current_time
-                    return self.state.current_gesture
+    def calibrated_poses(self) -> dict:
+        """Calibrated value of each gesture, in units of the raw signal"""
+        if self.mode == GestureMode.FIST_CURL:
+            return {'open': self.calibration.open_curl_score,
+                    'neutral': self.calibration.neutral_curl_score,
+                    'closed': self.calibration.closed_curl_score}
+        # The raw rotation signal is the unsigned normal angle, i.e. |signed angle|
+        return {'open': abs(self.calibration.palm_up_angle),
+                'neutral': abs(self.calibration.neutral_palm_angle),
+                'closed': abs(self.calibration.palm_down_angle)}
+
+    def calibrated_margin(self, gesture: str) -> float:
+        """Confidence margin the relative scoring gives at the gesture's calibrated pose"""
+        if self.mode == GestureMode.FIST_CURL:
+            scores = self.calculate_relative_curl_score(self.calibrated_poses()[gesture])
         else:
-            # Same as current gesture, stop transitioning
-            self.state.is_transitioning = False
-        
+            angles = {'open': self.calibration.palm_up_angle,
+                      'neutral': self.calibration.neutral_palm_angle,
+                      'closed': self.calibration.palm_down_angle}
+            scores = self.calculate_relative_rotation_score(angles[gesture])
+        sorted_scores = sorted(scores.values(), reverse=True)
+        return sorted_scores[0] - sorted_scores[1]
+
+    def fast_confirmation_strength(self, gesture: str, confidence: float) -> float:
+        """
+        Weight 0-1 of the current frame towards fast confirmation. Zero while the
+        signal is noisy or still moving, so those cases keep the full hold time.
+        """
+        if len(self.raw_signal_history) < self.raw_signal_history.capacity:
+            return 0.0
+
+        spacing = float(np.min(np.diff(sorted(self.calibrated_poses().values()))))
+        if spacing <= 0:
+            return 0.0
+
+        changes = np.abs(np.diff(self.raw_signal_history.values()))
+        if np.median(changes) > self.NOISE_GATE * spacing:
+            return 0.0
+        if changes[-1] > self.SETTLE_THRESHOLD * spacing:
+            return 0.0
+
+        margin = self.calibrated_margin(gesture)
+        if margin <= 0:
+            return 0.0
+        low, high = self.FAST_CONFIDENCE_RANGE
+        return float(np.clip((confidence / margin - low) / (high - low), 0, 1))
+
+    def required_hold_time(self, strength: float) -> float:
+        """Hold time needed to confirm a gesture at the given fast-path strength"""
+        return self.GESTURE_HOLD_TIME - strength * (self.GESTURE_HOLD_TIME - self.MIN_HOLD_TIME)
+
+    def update_state_machine(self, raw_gesture: str, confidence: float, scores: dict,
+                             timestamp: float = None, unfiltered_gesture: str = None) -> str:
+        """
+        State machine for gesture confirmation, with two paths:
+        - Hold path (unchanged): the gesture classified from the unfiltered
+          signal must agree for GESTURE_HOLD_TIME.
+        - Fast path: every frame whose filtered and unfiltered gestures both
+          agree with the fast candidate and whose fast-path strength s > 0,
+          the first one included, adds one frame interval /
+          required_hold_time(s) of evidence.
+        Whichever path completes first confirms the gesture.
+        """
+        current_time = time.time() if timestamp is None else timestamp
+        dt = current_time - self.state.last_update_time if self.state.last_update_time else 0.0
+        self.state.last_update_time = current_time
+        if 0 < dt <= 0.1:
+            self.frame_interval = 0.9 * self.frame_interval + 0.1 * dt
+        if unfiltered_gesture is None:
+            unfiltered_gesture = raw_gesture
+
+        confirmed = None
+
+        # Hold path
+        if unfiltered_gesture != self.state.candidate_state:
+            # Start transition, restart it for a different candidate, or stop
+            # transitioning when back to the current gesture
+            self.state.candidate_state = unfiltered_gesture
+            self.state.gesture_start_time = current_time
+        elif (unfiltered_gesture != self.state.current_gesture
+              and current_time - self.state.gesture_start_time >= self.GESTURE_HOLD_TIME):
+            confirmed = unfiltered_gesture
+
+        # Fast path. Each frame stands for one frame interval of hold, however
+        # long the gap before it.
+        if raw_gesture != self.state.fast_candidate:
+            self.state.fast_candidate = raw_gesture
+            self.state.candidate_evidence = 0.0
+        if raw_gesture != self.state.current_gesture and unfiltered_gesture == raw_gesture:
+            strength = self.fast_confirmation_strength(raw_gesture, confidence)
+            if strength > 0:
+                self.state.candidate_evidence += self.frame_interval / self.required_hold_time(strength)
+            if confirmed is None and self.state.candidate_evidence >= 1.0:
+                confirmed = raw_gesture
+
+        if confirmed is not None:
+            # Confirm gesture change
+            held_time = current_time - self.state.gesture_start_time
+            self.state.current_gesture = confirmed
+            self.reset_state_machine()
+            self.state.last_update_time = current_time
+
+            print(f"Gesture: {confirmed.upper()}")
+            print(f"  Confidence: {confidence:.3f}")
+            print(f"  Held: {held_time:.3f}s")
+            print(f"  Scores - Open: {scores['open']:.3f}, Neutral: {scores['neutral']:.3f}, Closed: {scores['closed']:.3f}")
+
+            return confirmed
+
+        self.state.is_transitioning = (self.state.candidate_state != self.state.current_gesture
+                                       or self.state.fast_candidate != self.state.current_gesture)
         return self.state.current_gesture
 
     def calculate_hand_velocity(self, current_position: np.ndarray) -> float:
@@ -327,25 +584,161 @@ class GestureRecognizer:
         velocity = np.linalg.norm(current_position - prev_position)
         return velocity
 
-    def process_hand(self, landmarks, image_shape: Tuple[int, int]) -> str:
+    def update_idle_governor(self, hand_present: bool):
+        """Switch between full-rate tracking and the low-rate idle probe"""
+        current_time = time.time()
+
+        if hand_present:
+            self.last_hand_time = current_time
+            if self.state.tracking_mode == "idle":
+                self.state.tracking_mode = "active"
+                print("[GOVERNOR] Hand detected, resuming full-rate tracking")
+        elif (self.state.tracking_mode == "active"
+              and current_time - self.last_hand_time >= self.IDLE_TIMEOUT):
+            self.state.tracking_mode = "idle"
+            print(f"[GOVERNOR] No hand for {self.IDLE_TIMEOUT:.1f}s, switching to idle probe")
+
+    def should_skip_frame(self) -> bool:
+        """In idle mode, skip frames between detection probes"""
+        if self.state.tracking_mode != "idle":
+            return False
+        return time.time() - self.last_probe_time < self.IDLE_PROBE_INTERVAL
+
+    def detect_hands(self, frame: np.ndarray):
+        """Run MediaPipe on the frame, downscaled while the governor is idle"""
+        if self.state.tracking_mode == "idle":
+            self.last_probe_time = time.time()
+            frame = cv2.resize(frame, None, fx=self.IDLE_PROBE_SCALE, fy=self.IDLE_PROBE_SCALE,
+                               interpolation=cv2.INTER_AREA)
+        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        return self.hands.process(rgb_frame)
+
+    def fit_motion(self, window: int, degree: int) -> np.ndarray:
+        """
+        Least-squares polynomial fit of the last window positions against capture
+        time, relative to the newest sample. Returns the coefficients (one column
+        per axis), or None when there are too few distinct samples.
+        """
+        count = min(len(self.position_history), window)
+        if count <= degree:
+            return None
+
+        times = self.time_history.values()[-count:]
+        positions = self.position_history.values()[-count:]
+        times = times - times[-1]
+        if np.ptp(times) <= 0:
+            return None
+        return np.polyfit(times, positions, degree)
+
+    @staticmethod
+    def shrink_to_deadzone(vector: np.ndarray, deadzone: float) -> np.ndarray:
+        """Scale vector by |v|^2 / (|v|^2 + deadzone^2): noise-sized values fade out, large ones pass"""
+        magnitude_sq = float(np.dot(vector, vector))
+        if magnitude_sq == 0.0:
+            return vector
+        return vector * (magnitude_sq / (magnitude_sq + deadzone ** 2))
+
+    def estimate_motion(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Estimate hand velocity and acceleration at the newest sample. A quadratic
+        over a few frames turns landmark jitter into large accelerations, so
+        velocity comes from a short linear fit and acceleration from a longer
+        quadratic one, both shrunk towards zero while they are noise-sized.
+        """
+        velocity = np.zeros(2)
+        acceleration = np.zeros(2)
+
+        linear = self.fit_motion(self.VELOCITY_WINDOW, 1)
+        if linear is not None:
+            velocity = self.shrink_to_deadzone(linear[0], self.VELOCITY_DEADZONE)
+
+        quadratic = self.fit_motion(self.ACCELERATION_WINDOW, 2)
+        if quadratic is not None:
+            acceleration = self.shrink_to_deadzone(2 * quadratic[0], self.ACCELERATION_DEADZONE)
+        return velocity, acceleration
+
+    def predict_hand_position(self, target_time: float, snapshot=None) -> Tuple[float, float]:
+        """
+        Extrapolate the hand position to target_time (seconds since the epoch),
+        from the given motion snapshot or the latest one.
+        Returns (-1, -1) when no hand is being tracked.
+        """
+        if snapshot is None:
+            snapshot = self.motion_snapshot
+        if snapshot is None:
+            return -1.0, -1.0
+
+        capture_time, position, velocity, acceleration = snapshot
+        dt = np.clip(target_time - capture_time, 0.0, self.MAX_PREDICTION_TIME)
+        predicted = position + velocity * dt + 0.5 * acceleration * dt ** 2
+        predicted = np.clip(predicted, 0.0, 1.0)
+        return float(predicted[0]), float(predicted[1])
+
+    def reset_motion(self):
+        """Forget motion history once the hand is lost"""
+        self.position_history.clear()
+        self.time_history.clear()
+        self.motion_snapshot = None
+        self.state.velocity_x = self.state.velocity_y = 0.0
+        self.state.acceleration_x = self.state.acceleration_y = 0.0
+
+    def reset_capture_clock(self):
+        """Forget the backend-to-wall-clock mapping, e.g. after reopening the camera"""
+        self.capture_offsets.clear()
+        self.last_backend_msec = 0.0
+
+    def frame_capture_time(self, cap, read_time: float) -> float:
+        """
+        Estimate when the frame just read was captured. Backends that report a
+        per-frame timestamp are mapped onto wall-clock time using the smallest
+        read delay over the last CLOCK_WINDOW frames, so frames that sat in the
+        driver's buffer get their older capture time while a single lucky read
+        or clock drift cannot skew the mapping for good. Falls back to
+        read_time otherwise.
+        """
+        backend_msec = cap.get(cv2.CAP_PROP_POS_MSEC)
+        if backend_msec <= 0:
+            return read_time
+        if backend_msec < self.last_backend_msec:
+            # Backend clock restarted, relearn the mapping
+            self.capture_offsets.clear()
+        self.last_backend_msec = backend_msec
+
+        self.capture_offsets.append(read_time - backend_msec / 1000.0)
+        return backend_msec / 1000.0 + float(np.min(self.capture_offsets.values()))
+
+    def process_hand(self, landmarks, image_shape: Tuple[int, int], capture_time: float = None) -> str:
         """Process hand landmarks and return detected gesture"""
-        # Calculate hand center for velocity tracking
+        timestamp = time.time() if capture_time is None else capture_time
+
+        # Calculate filtered hand center for velocity tracking
         hand_center = np.mean([[lm.x, lm.y] for lm in landmarks], axis=0)
+        hand_center = np.array([position_filter.filter(float(coord), timestamp)
+                                for position_filter, coord in zip(self.position_filters, hand_center)])
         velocity = self.calculate_hand_velocity(hand_center)
         
         self.position_history.append(hand_center)
+        self.time_history.append(timestamp)
         self.velocity_history.append(velocity)
+        velocity_vector, acceleration = self.estimate_motion()
+        self.motion_snapshot = (timestamp, hand_center, velocity_vector, acceleration)
 
-        # Store hand position in state (normalized coordinates 0-1)
+        # Store hand position and motion in state (normalized coordinates 0-1)
         self.state.hand_x = float(hand_center[0])
         self.state.hand_y = float(hand_center[1])
+        self.state.velocity_x = float(velocity_vector[0])
+        self.state.velocity_y = float(velocity_vector[1])
+        self.state.acceleration_x = float(acceleration[0])
+        self.state.acceleration_y = float(acceleration[1])
+        self.state.capture_timestamp = timestamp
 
         # Get raw gesture classification
-        raw_gesture, confidence, scores = self.classify_raw_gesture(landmarks)
+        raw_gesture, confidence, scores = self.classify_raw_gesture(landmarks, timestamp)
         self.gesture_history.append(raw_gesture)
 
         # Apply state machine for confirmation
-        confirmed_gesture = self.update_state_machine(raw_gesture, confidence, scores)
+        confirmed_gesture = self.update_state_machine(raw_gesture, confidence, scores, timestamp,
+                                                      self.unfiltered_gesture)
 
         return confirmed_gesture
 
@@ -356,8 +749,10 @@ class GestureRecognizer:
         
         if self.state.is_transitioning:
             color = self.colors['transitioning']
-            progress = (time.time() - self.state.gesture_start_time) / self.GESTURE_HOLD_TIME
-            progress = min(progress, 1.0)
+            held_progress = 0.0
+            if self.state.candidate_state != self.state.current_gesture:
+                held_progress = (time.time() - self.state.gesture_start_time) / self.GESTURE_HOLD_TIME
+            progress = min(max(self.state.candidate_evidence, held_progress), 1.0)
             bar_width = int(200 * progress)
             cv2.rectangle(image, (w - 250, 60), (w - 250 + bar_width, 80), color, -1)
             cv2.rectangle(image, (w - 250, 60), (w - 50, 80), color, 2)
@@ -366,6 +761,8 @@ class GestureRecognizer:
         # Status text
         mode_text = "Fist" if self.mode == GestureMode.FIST_CURL else "Rotation"
         status_text = f"Mode: {mode_text} | Gesture: {gesture.upper()}"
+        if self.state.tracking_mode == "idle":
+            status_text += " | IDLE"
         cv2.putText(image, status_text, (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.8, color, 2)
 
         # Calibration status
@@ -516,6 +913,8 @@ class GestureRecognizer:
         # Reset state when switching modes
         self.state.current_gesture = "neutral"
         self.state.is_transitioning = False
+        self.reset_filters()
+        self.reset_state_machine()
 
     def run(self):
         """Main loop for gesture recognition"""
@@ -529,32 +928,41 @@ class GestureRecognizer:
         print("- Press 'm' to switch between fist curl and wrist rotation modes")
 
         while cap.isOpened():
-            ret, frame = cap.read()
-            if not ret:
-                break
+            if self.should_skip_frame():
+                # Idle: grab without decoding so the camera buffer stays fresh
+                if not cap.grab():
+                    break
+            else:
+                ret, frame = cap.read()
+                if not ret:
+                    break
+                capture_time = self.frame_capture_time(cap, time.time())
 
-            frame = cv2.flip(frame, 1)
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            results = self.hands.process(rgb_frame)
+                frame = cv2.flip(frame, 1)
+                results = self.detect_hands(frame)
+                self.update_idle_governor(bool(results.multi_hand_landmarks))
 
-            if results.multi_hand_landmarks:
-                hand_landmarks = results.multi_hand_landmarks[0]
-                
-                # Check if current mode is calibrated
-                is_calibrated = (self.calibration.fist_initialized if self.mode == GestureMode.FIST_CURL 
-                               else self.calibration.rotation_initialized)
-                
-                if is_calibrated:
-                    gesture = self.process_hand(hand_landmarks.landmark, frame.shape)
-                    frame = self.draw_feedback(frame, gesture, hand_landmarks)
+                if results.multi_hand_landmarks:
+                    hand_landmarks = results.multi_hand_landmarks[0]
+                    
+                    # Check if current mode is calibrated
+                    is_calibrated = (self.calibration.fist_initialized if self.mode == GestureMode.FIST_CURL 
+                                   else self.calibration.rotation_initialized)
+                    
+                    if is_calibrated:
+                        gesture = self.process_hand(hand_landmarks.landmark, frame.shape, capture_time)
+                        frame = self.draw_feedback(frame, gesture, hand_landmarks)
+                    else:
+                        frame = self.draw_feedback(frame, "neutral", hand_landmarks)
                 else:
-                    frame = self.draw_feedback(frame, "neutral", hand_landmarks)
-            else:
-                self.state.hand_x = -1.0
-                self.state.hand_y = -1.0
-                frame = self.draw_feedback(frame, "neutral", None)
+                    self.state.hand_x = -1.0
+                    self.state.hand_y = -1.0
+                    self.reset_filters()
+                    self.reset_state_machine()
+                    self.reset_motion()
+                    frame = self.draw_feedback(frame, "neutral", None)
 
-            cv2.imshow('Gesture Recognition', frame)
+                cv2.imshow('Gesture Recognition', frame)
 
             key = cv2.waitKey(1) & 0xFF
             if key == ord('q'):
@@ -567,6 +975,8 @@ class GestureRecognizer:
                     cap = cv2.VideoCapture(0, cv2.CAP_ANY)
                     cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
                     cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+                    self.update_idle_governor(True)
+                    self.reset_capture_clock()
                 else:
                     break
             elif key == ord('m'):
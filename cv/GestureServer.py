@@ -1,20 +1,26 @@
+import argparse
 import socket
 import threading
 import json
+import select
 import struct
 import time
-from GestureRecognizer import GestureRecognizer
+from GestureRecognizer import GestureRecognizer, DEFAULT_IDLE_TIMEOUT, DEFAULT_IDLE_PROBE_INTERVAL
 
 class GestureServer:
-    def __init__(self, host='127.0.0.1', port=8081):
+    def __init__(self, host='127.0.0.1', port=8081, idle_timeout=DEFAULT_IDLE_TIMEOUT,
+                 idle_probe_interval=DEFAULT_IDLE_PROBE_INTERVAL):
         self.host = host
         self.port = port
         self.running = False
-        self.gesture_recognizer = GestureRecognizer()
+        self.gesture_recognizer = GestureRecognizer(idle_timeout=idle_timeout,
+                                                    idle_probe_interval=idle_probe_interval)
         self.last_gesture = "neutral"  # Track gesture changes
+        self.send_interval = 0.1  # 10 FPS
+        self.request_timeout = 1.0  # seconds allowed to finish reading a request
 
-    def get_gesture_data(self):
-        """Get current gesture data"""
+    def get_gesture_data(self, predict_at=None):
+        """Get current gesture data, optionally with the hand position predicted at predict_at"""
         current_gesture = self.gesture_recognizer.state.current_gesture
         confidence = self.gesture_recognizer.state.confidence
 
@@ -23,45 +29,99 @@ class GestureServer:
             print(f"[GESTURE] Changed: {self.last_gesture} -> {current_gesture} (confidence: {confidence:.2f})")
             self.last_gesture = current_gesture
 
+        # Read the motion fields from one snapshot so they all describe the same frame
+        snapshot = self.gesture_recognizer.motion_snapshot
+        if snapshot is None:
+            capture_timestamp = 0.0
+            position = (-1.0, -1.0)
+            velocity = acceleration = (0.0, 0.0)
+        else:
+            capture_timestamp, position, velocity, acceleration = snapshot
+
         data = {
             "gesture": current_gesture,
             "confidence": confidence,
             "is_transitioning": self.gesture_recognizer.state.is_transitioning,
-            "hand_x": self.gesture_recognizer.state.hand_x,
-            "hand_y": self.gesture_recognizer.state.hand_y,
+            "hand_x": float(position[0]),
+            "hand_y": float(position[1]),
+            "velocity_x": float(velocity[0]),
+            "velocity_y": float(velocity[1]),
+            "acceleration_x": float(acceleration[0]),
+            "acceleration_y": float(acceleration[1]),
+            "capture_timestamp": capture_timestamp,
+            "tracking_mode": self.gesture_recognizer.state.tracking_mode,
             "timestamp": time.time()
         }
+
+        if predict_at is not None:
+            predicted_x, predicted_y = self.gesture_recognizer.predict_hand_position(predict_at, snapshot)
+            data["predict_at"] = predict_at
+            data["predicted_x"] = predicted_x
+            data["predicted_y"] = predicted_y
+
         return data
 
+    def send_message(self, client_socket, data):
+        """Send a length-prefixed JSON message"""
+        data_bytes = json.dumps(data).encode('utf-8')
+
+        # Send length first (4 bytes, big-endian)
+        length_bytes = struct.pack('>I', len(data_bytes))
+        client_socket.sendall(length_bytes + data_bytes)
+
+    def receive_exact(self, client_socket, length):
+        """Read exactly length bytes from the socket"""
+        buffer = b''
+        while len(buffer) < length:
+            chunk = client_socket.recv(length - len(buffer))
+            if not chunk:
+                raise ConnectionError("Client closed the connection")
+            buffer += chunk
+        return buffer
+
+    def receive_message(self, client_socket):
+        """Receive a length-prefixed JSON request, giving up on a stalled partial request"""
+        client_socket.settimeout(self.request_timeout)
+        try:
+            length = struct.unpack('>I', self.receive_exact(client_socket, 4))[0]
+            return json.loads(self.receive_exact(client_socket, length).decode('utf-8'))
+        finally:
+            client_socket.settimeout(None)
+
     def handle_client(self, client_socket, client_address):
         """Handle client connection"""
         print(f"[SERVER] Client connected: {client_address}")
         message_count = 0
 
+        next_send_time = time.time()
+
         try:
             while self.running:
-                data = self.get_gesture_data()
-                json_data = json.dumps(data)
-                data_bytes = json_data.encode('utf-8')
-
-                # Send length first (4 bytes, big-endian)
-                length = len(data_bytes)
-                length_bytes = struct.pack('>I', length)
-
-                client_socket.send(length_bytes)
-                client_socket.send(data_bytes)
-
-                message_count += 1
-
-                # Debug every 10 messages (1 second)
-                if message_count % 10 == 0:
-                    print(f"[SERVER] Sent to {client_address}: {data}")
-
-                # Debug first few messages to verify data flow
-                if message_count <= 3:
-                    print(f"[SERVER] Message {message_count} to {client_address}: {json_data}")
-
-                time.sleep(0.1)  # 10 FPS
+                # Periodic update is due regardless of pending prediction requests
+                if time.time() >= next_send_time:
+                    data = self.get_gesture_data()
+                    self.send_message(client_socket, data)
+                    next_send_time = time.time() + self.send_interval
+
+                    message_count += 1
+
+                    # Debug every 10 messages (1 second)
+                    if message_count % 10 == 0:
+                        print(f"[SERVER] Sent to {client_address}: {data}")
+
+                    # Debug first few messages to verify data flow
+                    if message_count <= 3:
+                        print(f"[SERVER] Message {message_count} to {client_address}: {json.dumps(data)}")
+
+                # Wait for the next update, answering prediction requests meanwhile.
+                # Clients may send {"predict_at": <epoch seconds>} to get the hand
+                # position extrapolated to that time in an immediate reply.
+                timeout = max(0.0, next_send_time - time.time())
+                readable, _, _ = select.select([client_socket], [], [], timeout)
+                if readable:
+                    request = self.receive_message(client_socket)
+                    if "predict_at" in request:
+                        self.send_message(client_socket, self.get_gesture_data(float(request["predict_at"])))
 
         except Exception as e:
             print(f"[SERVER] Client {client_address} disconnected: {e}")
@@ -117,7 +177,14 @@ class GestureServer:
             self.running = False
 
 if __name__ == "__main__":
-    server = GestureServer()
+    parser = argparse.ArgumentParser(description="Gesture TCP Server")
+    parser.add_argument("--idle-timeout", type=float, default=DEFAULT_IDLE_TIMEOUT,
+                        help="seconds without a hand before switching to the idle probe")
+    parser.add_argument("--idle-probe-interval", type=float, default=DEFAULT_IDLE_PROBE_INTERVAL,
+                        help="seconds between idle detection probes")
+    args = parser.parse_args()
+
+    server = GestureServer(idle_timeout=args.idle_timeout, idle_probe_interval=args.idle_probe_interval)
     print("Starting Gesture TCP Server...")
     print("Press Ctrl+C to stop")
     server.run()
\ No newline at end of file